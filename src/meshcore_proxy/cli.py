@@ -9,8 +9,19 @@ import sys
 
 from meshcore_proxy.proxy import EventLogLevel, MeshCoreProxy
 
+# Run on uvloop when it is installed (the "speedups" extra); same API, faster socket I/O.
+# uvloop.run only exists from 0.18, so an older system-wide uvloop falls back too.
+try:
+    import uvloop
 
-def parse_args() -> argparse.Namespace:
+    _run = getattr(uvloop, "run", asyncio.run)
+except ImportError:
+    _run = asyncio.run
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="TCP proxy for MeshCore companion radios",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -103,7 +114,11 @@ Examples:
         help="Enable debug logging",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 async def run_with_shutdown(proxy: MeshCoreProxy) -> None:
@@ -190,7 +205,7 @@ def main() -> int:
 
     # Run with signal handling
     try:
-        asyncio.run(run_with_shutdown(proxy))
+        _run(run_with_shutdown(proxy))
         return 0
     except Exception as e:
         logging.error(f"Fatal error: {e}")
@@ -1,267 +1,295 @@
 """MeshCore protocol payload decoder for human-readable event logging."""
 
-import io
+import re
 import struct
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+Decoder = Callable[[bytes], Optional[dict[str, Any]]]
+
+# Precompiled little-endian layouts for fixed-size payload fields
+_U16_LE = struct.Struct("<H")
+_U32_LE = struct.Struct("<I")
+_MSG_SENT = struct.Struct("<B4sI")
+_BATTERY = struct.Struct("<HII")
+_LOGIN_SUCCESS = struct.Struct("<B6s")
+_TELEMETRY_RESPONSE = struct.Struct("<x6s")  # skips the reserved byte
+_BINARY_RESPONSE = struct.Struct("<x4s")  # skips the reserved byte
+_CONTACT_HDR = struct.Struct("<6s26xBBb")  # public key prefix only
+_CONTACT_TAIL = struct.Struct("<Iii")
+_SELF_INFO = struct.Struct("<BBB6s26xii4xIIBB")  # public key prefix only
+_CONTACT_MSG = struct.Struct("<6sBBI")
+_CHANNEL_MSG = struct.Struct("<BBBI")
+_CORE_STATS = struct.Struct("<HIHB")
+_RADIO_STATS = struct.Struct("<hbbII")
+_PACKETS_STATS = struct.Struct("<IIIIII")
+_SEND_MSG = struct.Struct("<BBI6s")
+_SEND_CHAN_MSG = struct.Struct("<xBI")
+_SET_RADIO = struct.Struct("<IIBB")
+_COORDS = struct.Struct("<ii")
+
+# "key:value" pairs in a comma-separated CUSTOM_VARS list; values may contain ':'
+_CUSTOM_VAR_RE = re.compile(r"([^,:]*):([^,]*)")
+
+# Enum value names used in decoded output
+_CONTACT_TYPES = {0: "node", 1: "repeater", 2: "room"}
+_SELF_TYPES = {0: "node", 1: "client", 2: "repeater", 3: "room"}
+_TXT_TYPES = {0: "text", 1: "command", 2: "signed"}
+_CHAN_TXT_TYPES = {0: "text", 1: "command"}
+_STATS_TYPES = {0: "core", 1: "radio", 2: "packets"}
+
+# Fallback names for single-byte enum values, built once so lookups of known
+# values don't format a throwaway default string
+_UNKNOWN_NAMES = tuple(f"unknown({value})" for value in range(256))
+
+# Stats sub-type -> (layout, label, field names)
+_STATS_DISPATCH: dict[int, tuple[struct.Struct, str, tuple[str, ...]]] = {
+    0: (_CORE_STATS, "core", ("battery_mv", "uptime_secs", "errors", "queue_len")),
+    1: (
+        _RADIO_STATS,
+        "radio",
+        ("noise_floor", "last_rssi", "last_snr", "tx_air_secs", "rx_air_secs"),
+    ),
+    2: (
+        _PACKETS_STATS,
+        "packets",
+        ("recv", "sent", "flood_tx", "direct_tx", "flood_rx", "direct_rx"),
+    ),
+}
 
 
 def decode_response(packet_type: int, payload: bytes) -> Optional[dict[str, Any]]:
     """
     Decode a response payload from the radio into a human-readable dict.
-    Returns None if decoding fails or packet type is unknown.
+    Returns None if the payload is too short or packet type is unknown.
     """
-    if len(payload) < 1:
+    handler = _RESPONSE_HANDLERS.get(packet_type)
+    if handler is None or len(payload) < _RESPONSE_MIN_LEN.get(packet_type, 1):
         return None
 
-    try:
-        buf = io.BytesIO(payload[1:])  # Skip packet type byte
+    return handler(payload)
 
-        if packet_type == 0x00:  # OK
-            result = {"status": "OK"}
-            if len(payload) == 5:
-                result["value"] = int.from_bytes(payload[1:5], byteorder="little")
-            return result
 
-        elif packet_type == 0x01:  # ERROR
-            result = {"status": "ERROR"}
-            if len(payload) > 1:
-                result["error_code"] = payload[1]
-            return result
-
-        elif packet_type == 0x02:  # CONTACT_START
-            return {"contact_count": int.from_bytes(payload[1:5], byteorder="little")}
-
-        elif packet_type == 0x03 or packet_type == 0x8A:  # CONTACT or NEW_ADVERT
-            return _decode_contact(buf)
-
-        elif packet_type == 0x04:  # CONTACT_END
-            return {"lastmod": int.from_bytes(buf.read(4), byteorder="little")}
+def decode_command(packet_type: int, payload: bytes) -> Optional[dict[str, Any]]:
+    """
+    Decode a command payload going to the radio into a human-readable dict.
+    Returns None if the payload is too short or packet type is unknown.
+    """
+    handler = _COMMAND_HANDLERS.get(packet_type)
+    if handler is None or len(payload) < _COMMAND_MIN_LEN.get(packet_type, 1):
+        return None
 
-        elif packet_type == 0x05:  # SELF_INFO
-            return _decode_self_info(buf)
+    return handler(payload)
 
-        elif packet_type == 0x06:  # MSG_SENT
-            msg_type = buf.read(1)[0]
-            expected_ack = buf.read(4).hex()
-            suggested_timeout = int.from_bytes(buf.read(4), byteorder="little")
-            return {
-                "msg_type": msg_type,
-                "expected_ack": expected_ack,
-                "timeout_ms": suggested_timeout,
-            }
 
-        elif packet_type == 0x07:  # CONTACT_MSG_RECV
-            return _decode_contact_msg(buf)
+def _u32_field(key: str) -> Decoder:
+    """Build a handler for payloads carrying a single little-endian u32 after the type byte."""
+    unpack_from = _U32_LE.unpack_from
 
-        elif packet_type == 0x08:  # CHANNEL_MSG_RECV
-            return _decode_channel_msg(buf)
+    def decode(payload: bytes) -> dict[str, Any]:
+        return {key: unpack_from(payload, 1)[0]}
 
-        elif packet_type == 0x09:  # CURRENT_TIME
-            return {"time": int.from_bytes(buf.read(4), byteorder="little")}
+    return decode
 
-        elif packet_type == 0x0A:  # NO_MORE_MSGS
-            return {"messages_available": False}
 
-        elif packet_type == 0x0B:  # CONTACT_URI
-            return {"uri": "meshcore://" + buf.read().hex()}
+# Response handlers (radio -> client). Each takes the full payload,
+# including the packet type byte. Fixed fields are read with Struct.unpack_from
+# at an offset; byte ranges that get hex-encoded or decoded are plain slices,
+# which are cheaper than a memoryview for frames of MeshCore's size.
 
-        elif packet_type == 0x0C:  # BATTERY
-            level = int.from_bytes(buf.read(2), byteorder="little")
-            result = {"level_mv": level}
-            if len(payload) > 3:
-                result["used_kb"] = int.from_bytes(buf.read(4), byteorder="little")
-                result["total_kb"] = int.from_bytes(buf.read(4), byteorder="little")
-            return result
 
-        elif packet_type == 0x0D:  # DEVICE_INFO
-            return _decode_device_info(buf, payload)
+def _decode_ok(payload: bytes) -> dict[str, Any]:
+    result = {"status": "OK"}
+    if len(payload) == 5:
+        result["value"] = _U32_LE.unpack_from(payload, 1)[0]
+    return result
 
-        elif packet_type == 0x12:  # CHANNEL_INFO
-            return _decode_channel_info(buf)
 
-        elif packet_type == 0x80:  # ADVERTISEMENT
-            return {"public_key": buf.read(32).hex()}
+def _decode_error(payload: bytes) -> dict[str, Any]:
+    result = {"status": "ERROR"}
+    if len(payload) > 1:
+        result["error_code"] = payload[1]
+    return result
 
-        elif packet_type == 0x81:  # PATH_UPDATE
-            return {"public_key": buf.read(32).hex()}
 
-        elif packet_type == 0x82:  # ACK
-            if len(payload) >= 5:
-                return {"ack_code": buf.read(4).hex()}
-            return {"ack": True}
+def _decode_msg_sent(payload: bytes) -> dict[str, Any]:
+    msg_type, expected_ack, suggested_timeout = _MSG_SENT.unpack_from(payload, 1)
+    return {
+        "msg_type": msg_type,
+        "expected_ack": expected_ack.hex(),
+        "timeout_ms": suggested_timeout,
+    }
 
-        elif packet_type == 0x83:  # MESSAGES_WAITING
-            return {"messages_waiting": True}
 
-        elif packet_type == 0x85:  # LOGIN_SUCCESS
-            result = {"login": "success"}
-            if len(payload) > 1:
-                perms = buf.read(1)[0]
-                result["is_admin"] = (perms & 1) == 1
-                result["pubkey_prefix"] = buf.read(6).hex()
-            return result
+def _decode_no_more_msgs(payload: bytes) -> dict[str, Any]:
+    return {"messages_available": False}
 
-        elif packet_type == 0x86:  # LOGIN_FAILED
-            return {"login": "failed"}
 
-        elif packet_type == 0x87:  # STATUS_RESPONSE
-            return {"status_response": True, "data_len": len(payload) - 1}
+def _decode_contact_uri(payload: bytes) -> dict[str, Any]:
+    return {"uri": "meshcore://" + payload[1:].hex()}
 
-        elif packet_type == 0x8B:  # TELEMETRY_RESPONSE
-            buf.read(1)  # reserved
-            return {"pubkey_prefix": buf.read(6).hex(), "telemetry_len": len(payload) - 8}
 
-        elif packet_type == 0x8C:  # BINARY_RESPONSE
-            buf.read(1)  # reserved
-            tag = buf.read(4).hex()
-            return {"tag": tag, "data_len": len(payload) - 6}
+def _decode_battery(payload: bytes) -> dict[str, Any]:
+    if len(payload) >= 11:
+        level, used_kb, total_kb = _BATTERY.unpack_from(payload, 1)
+        return {"level_mv": level, "used_kb": used_kb, "total_kb": total_kb}
+    return {"level_mv": _U16_LE.unpack_from(payload, 1)[0]}
 
-        elif packet_type == 0x18:  # STATS (24)
-            return _decode_stats(payload)
 
-        elif packet_type == 0x15:  # CUSTOM_VARS
-            raw = buf.read().decode("utf-8", "ignore")
-            if raw:
-                pairs = {}
-                for p in raw.split(","):
-                    if ":" in p:
-                        k, v = p.split(":", 1)
-                        pairs[k] = v
-                return {"vars": pairs}
-            return {"vars": {}}
+def _decode_public_key(payload: bytes) -> dict[str, Any]:
+    return {"public_key": payload[1:33].hex()}
 
-    except Exception:
-        pass
 
-    return None
+def _decode_ack(payload: bytes) -> dict[str, Any]:
+    if len(payload) >= 5:
+        return {"ack_code": payload[1:5].hex()}
+    return {"ack": True}
 
 
-def decode_command(packet_type: int, payload: bytes) -> Optional[dict[str, Any]]:
-    """
-    Decode a command payload going to the radio into a human-readable dict.
-    Returns None if decoding fails or packet type is unknown.
-    """
-    if len(payload) < 1:
-        return None
+def _decode_messages_waiting(payload: bytes) -> dict[str, Any]:
+    return {"messages_waiting": True}
+
+
+def _decode_login_success(payload: bytes) -> dict[str, Any]:
+    result = {"login": "success"}
+    if len(payload) >= 8:
+        perms, pubkey_prefix = _LOGIN_SUCCESS.unpack_from(payload, 1)
+        result["is_admin"] = (perms & 1) == 1
+        result["pubkey_prefix"] = pubkey_prefix.hex()
+    return result
+
+
+def _decode_login_failed(payload: bytes) -> dict[str, Any]:
+    return {"login": "failed"}
+
+
+def _decode_status_response(payload: bytes) -> dict[str, Any]:
+    return {"status_response": True, "data_len": len(payload) - 1}
+
+
+def _decode_telemetry_response(payload: bytes) -> dict[str, Any]:
+    (pubkey_prefix,) = _TELEMETRY_RESPONSE.unpack_from(payload, 1)
+    return {"pubkey_prefix": pubkey_prefix.hex(), "telemetry_len": len(payload) - 8}
+
+
+def _decode_binary_response(payload: bytes) -> dict[str, Any]:
+    (tag,) = _BINARY_RESPONSE.unpack_from(payload, 1)
+    return {"tag": tag.hex(), "data_len": len(payload) - 6}
+
+
+def _decode_custom_vars(payload: bytes) -> dict[str, Any]:
+    raw = payload[1:].decode("utf-8", "ignore")
+    return {"vars": dict(_CUSTOM_VAR_RE.findall(raw))}
+
+
+# Command handlers (client -> radio). Each takes the full payload,
+# including the command type byte.
+
+
+def _decode_cmd_appstart(payload: bytes) -> dict[str, Any]:
+    app_name = payload[2:].decode("utf-8", "ignore").strip()
+    return {"version": payload[1], "app": app_name}
+
+
+def _decode_cmd_send_msg(payload: bytes) -> dict[str, Any]:
+    # dst is the first 6 bytes of the destination public key
+    msg_type, attempt, timestamp, dst = _SEND_MSG.unpack_from(payload, 1)
+    text = payload[13:].decode("utf-8", "ignore")
+    return {
+        "type": "command" if msg_type == 1 else "message",
+        "attempt": attempt,
+        "timestamp": timestamp,
+        "to": dst.hex(),
+        "text": text[:50] + "..." if len(text) > 50 else text,
+    }
+
+
+def _decode_cmd_send_chan_msg(payload: bytes) -> dict[str, Any]:
+    chan, timestamp = _SEND_CHAN_MSG.unpack_from(payload, 1)  # skip flags
+    text = payload[7:].decode("utf-8", "ignore")
+    return {
+        "channel": chan,
+        "timestamp": timestamp,
+        "text": text[:50] + "..." if len(text) > 50 else text,
+    }
+
+
+def _decode_cmd_get_contacts(payload: bytes) -> dict[str, Any]:
+    result = {}
+    if len(payload) >= 5:
+        result["lastmod"] = _U32_LE.unpack_from(payload, 1)[0]
+    return result
+
+
+def _decode_cmd_set_name(payload: bytes) -> dict[str, Any]:
+    return {"name": payload[1:].decode("utf-8", "ignore")}
+
+
+def _decode_cmd_set_radio(payload: bytes) -> dict[str, Any]:
+    freq, bw, sf, cr = _SET_RADIO.unpack_from(payload, 1)
+    return {"freq_mhz": freq / 1000, "bw_khz": bw / 1000, "sf": sf, "cr": cr}
+
+
+def _decode_cmd_set_coords(payload: bytes) -> dict[str, Any]:
+    lat, lon = _COORDS.unpack_from(payload, 1)
+    return {"lat": lat / 1e6, "lon": lon / 1e6}
+
+
+def _decode_cmd_device_query(payload: bytes) -> dict[str, Any]:
+    return {"query": "device_info"}
+
+
+def _decode_cmd_send_login(payload: bytes) -> dict[str, Any]:
+    return {"to": payload[1:7].hex() + "...", "password": "***"}
+
+
+def _decode_cmd_get_channel(payload: bytes) -> dict[str, Any]:
+    return {"channel_idx": payload[1]}
+
+
+def _decode_cmd_set_channel(payload: bytes) -> dict[str, Any]:
+    idx = payload[1]
+    name = _cstr(payload, 2, 32)
+    return {"channel_idx": idx, "name": name}
 
-    try:
-        buf = io.BytesIO(payload[1:])  # Skip command type byte
-
-        if packet_type == 0x01:  # APPSTART
-            if len(payload) >= 3:
-                version = payload[1]
-                app_name = payload[2:].decode("utf-8", "ignore").strip()
-                return {"version": version, "app": app_name}
-
-        elif packet_type == 0x02:  # SEND_MSG
-            msg_type = buf.read(1)[0]
-            attempt = buf.read(1)[0]
-            timestamp = int.from_bytes(buf.read(4), byteorder="little")
-            dst = buf.read(6).hex()  # First 6 bytes of destination
-            text = buf.read().decode("utf-8", "ignore")
-            return {
-                "type": "command" if msg_type == 1 else "message",
-                "attempt": attempt,
-                "timestamp": timestamp,
-                "to": dst,
-                "text": text[:50] + "..." if len(text) > 50 else text,
-            }
-
-        elif packet_type == 0x03:  # SEND_CHAN_MSG
-            buf.read(1)  # flags
-            chan = buf.read(1)[0]
-            timestamp = int.from_bytes(buf.read(4), byteorder="little")
-            text = buf.read().decode("utf-8", "ignore")
-            return {
-                "channel": chan,
-                "timestamp": timestamp,
-                "text": text[:50] + "..." if len(text) > 50 else text,
-            }
-
-        elif packet_type == 0x04:  # GET_CONTACTS
-            result = {}
-            if len(payload) > 1:
-                result["lastmod"] = int.from_bytes(buf.read(4), byteorder="little")
-            return result
-
-        elif packet_type == 0x06:  # SET_TIME
-            return {"time": int.from_bytes(buf.read(4), byteorder="little")}
-
-        elif packet_type == 0x08:  # SET_NAME
-            return {"name": buf.read().decode("utf-8", "ignore")}
-
-        elif packet_type == 0x0B:  # SET_RADIO
-            freq = int.from_bytes(buf.read(4), byteorder="little") / 1000
-            bw = int.from_bytes(buf.read(4), byteorder="little") / 1000
-            sf = buf.read(1)[0]
-            cr = buf.read(1)[0]
-            return {"freq_mhz": freq, "bw_khz": bw, "sf": sf, "cr": cr}
-
-        elif packet_type == 0x0C:  # SET_TX_POWER
-            return {"tx_power": int.from_bytes(buf.read(4), byteorder="little")}
-
-        elif packet_type == 0x0E:  # SET_COORDS
-            lat = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-            lon = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-            return {"lat": lat, "lon": lon}
-
-        elif packet_type == 0x16:  # DEVICE_QUERY
-            return {"query": "device_info"}
-
-        elif packet_type == 0x1A:  # SEND_LOGIN
-            dst = buf.read(32).hex()
-            pwd = buf.read().decode("utf-8", "ignore")
-            return {"to": dst[:12] + "...", "password": "***"}
-
-        elif packet_type == 0x1F:  # GET_CHANNEL
-            return {"channel_idx": buf.read(1)[0]}
-
-        elif packet_type == 0x20:  # SET_CHANNEL
-            idx = buf.read(1)[0]
-            name = buf.read(32).decode("utf-8", "ignore").rstrip("\x00")
-            return {"channel_idx": idx, "name": name}
-
-        elif packet_type == 0x25:  # SET_DEVICE_PIN
-            return {"pin": int.from_bytes(buf.read(4), byteorder="little")}
-
-        elif packet_type == 0x27:  # GET_TELEMETRY
-            buf.read(3)  # reserved
-            if len(payload) > 4:
-                return {"target": buf.read(6).hex()}
-            return {"target": "self"}
-
-        elif packet_type == 0x34:  # PATH_DISCOVERY
-            buf.read(1)  # reserved
-            return {"target": buf.read(32).hex()[:12] + "..."}
-
-        elif packet_type == 0x38:  # GET_STATS
-            stats_type = buf.read(1)[0]
-            types = {0: "core", 1: "radio", 2: "packets"}
-            return {"stats_type": types.get(stats_type, f"unknown({stats_type})")}
-
-    except Exception:
-        pass
-
-    return None
-
-
-def _decode_contact(buf: io.BytesIO) -> dict[str, Any]:
+
+def _decode_cmd_get_telemetry(payload: bytes) -> dict[str, Any]:
+    # Skip 3 reserved bytes
+    if len(payload) > 4:
+        return {"target": payload[4:10].hex()}
+    return {"target": "self"}
+
+
+def _decode_cmd_path_discovery(payload: bytes) -> dict[str, Any]:
+    # Skip the reserved byte
+    return {"target": payload[2:8].hex() + "..."}
+
+
+def _decode_cmd_get_stats(payload: bytes) -> dict[str, Any]:
+    stats_type = payload[1]
+    return {"stats_type": _STATS_TYPES.get(stats_type, _UNKNOWN_NAMES[stats_type])}
+
+
+def _cstr(payload: bytes, start: int, size: int) -> str:
+    """Decode a fixed-size, NUL-padded string field."""
+    end = payload.find(0, start, start + size)
+    if end < 0:
+        end = start + size
+    return payload[start:end].decode("utf-8", "ignore")
+
+
+def _decode_contact(payload: bytes) -> dict[str, Any]:
     """Decode a contact record."""
-    public_key = buf.read(32).hex()
-    contact_type = buf.read(1)[0]
-    flags = buf.read(1)[0]
-    path_len = int.from_bytes(buf.read(1), signed=True, byteorder="little")
-    buf.read(64)  # path data
-    name = buf.read(32).decode("utf-8", "ignore").replace("\0", "")
-    last_advert = int.from_bytes(buf.read(4), byteorder="little")
-    lat = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-    lon = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-
-    type_names = {0: "node", 1: "repeater", 2: "room"}
+    key_prefix, contact_type, flags, path_len = _CONTACT_HDR.unpack_from(payload, 1)
+    # 64 bytes of path data follow at offset 36
+    name = _cstr(payload, 100, 32)
+    last_advert, lat, lon = _CONTACT_TAIL.unpack_from(payload, 132)
+    lat /= 1e6
+    lon /= 1e6
+
     return {
         "name": name,
-        "public_key": public_key[:12] + "...",
-        "type": type_names.get(contact_type, f"unknown({contact_type})"),
+        "public_key": key_prefix.hex() + "...",
+        "type": _CONTACT_TYPES.get(contact_type, _UNKNOWN_NAMES[contact_type]),
         "path_len": path_len,
         "last_advert": last_advert,
         "lat": lat if lat != 0 else None,
@@ -269,29 +297,22 @@ def _decode_contact(buf: io.BytesIO) -> dict[str, Any]:
     }
 
 
-def _decode_self_info(buf: io.BytesIO) -> dict[str, Any]:
+def _decode_self_info(payload: bytes) -> dict[str, Any]:
     """Decode SELF_INFO response."""
-    adv_type = buf.read(1)[0]
-    tx_power = buf.read(1)[0]
-    max_tx_power = buf.read(1)[0]
-    public_key = buf.read(32).hex()
-    lat = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-    lon = int.from_bytes(buf.read(4), byteorder="little", signed=True) / 1e6
-    buf.read(1)  # multi_acks
-    buf.read(1)  # adv_loc_policy
-    buf.read(1)  # telemetry_mode
-    buf.read(1)  # manual_add_contacts
-    freq = int.from_bytes(buf.read(4), byteorder="little") / 1000
-    bw = int.from_bytes(buf.read(4), byteorder="little") / 1000
-    sf = buf.read(1)[0]
-    cr = buf.read(1)[0]
-    name = buf.read().decode("utf-8", "ignore")
-
-    type_names = {0: "node", 1: "client", 2: "repeater", 3: "room"}
+    # Skips multi_acks, adv_loc_policy, telemetry_mode and manual_add_contacts
+    adv_type, tx_power, max_tx_power, key_prefix, lat, lon, freq, bw, sf, cr = (
+        _SELF_INFO.unpack_from(payload, 1)
+    )
+    name = payload[58:].decode("utf-8", "ignore")
+    lat /= 1e6
+    lon /= 1e6
+    freq /= 1000
+    bw /= 1000
+
     return {
         "name": name,
-        "type": type_names.get(adv_type, f"unknown({adv_type})"),
-        "public_key": public_key[:12] + "...",
+        "type": _SELF_TYPES.get(adv_type, _UNKNOWN_NAMES[adv_type]),
+        "public_key": key_prefix.hex() + "...",
         "tx_power": tx_power,
         "freq_mhz": freq,
         "bw_khz": bw,
@@ -302,119 +323,198 @@ def _decode_self_info(buf: io.BytesIO) -> dict[str, Any]:
     }
 
 
-def _decode_device_info(buf: io.BytesIO, payload: bytes) -> dict[str, Any]:
+def _decode_device_info(payload: bytes) -> dict[str, Any]:
     """Decode DEVICE_INFO response."""
-    fw_ver = buf.read(1)[0]
+    fw_ver = payload[1]
     result = {"fw_version": fw_ver}
 
-    if payload[1] >= 3 and len(payload) > 60:
-        result["max_contacts"] = buf.read(1)[0] * 2
-        result["max_channels"] = buf.read(1)[0]
-        buf.read(4)  # ble_pin
-        result["fw_build"] = buf.read(12).decode("utf-8", "ignore").replace("\0", "")
-        result["model"] = buf.read(40).decode("utf-8", "ignore").replace("\0", "")
-        result["version"] = buf.read(20).decode("utf-8", "ignore").replace("\0", "")
+    if fw_ver >= 3 and len(payload) > 60:
+        result["max_contacts"] = payload[2] * 2
+        result["max_channels"] = payload[3]
+        # 4 bytes of ble_pin at offset 4
+        result["fw_build"] = _cstr(payload, 8, 12)
+        result["model"] = _cstr(payload, 20, 40)
+        result["version"] = _cstr(payload, 60, 20)
 
     return result
 
 
-def _decode_channel_info(buf: io.BytesIO) -> dict[str, Any]:
+def _decode_channel_info(payload: bytes) -> dict[str, Any]:
     """Decode CHANNEL_INFO response."""
-    idx = buf.read(1)[0]
-    name_bytes = buf.read(32)
-    null_pos = name_bytes.find(0)
-    if null_pos >= 0:
-        name = name_bytes[:null_pos].decode("utf-8", "ignore")
-    else:
-        name = name_bytes.decode("utf-8", "ignore")
-    return {"channel_idx": idx, "name": name}
+    return {"channel_idx": payload[1], "name": _cstr(payload, 2, 32)}
 
 
-def _decode_contact_msg(buf: io.BytesIO) -> dict[str, Any]:
+def _decode_contact_msg(payload: bytes) -> dict[str, Any]:
     """Decode a contact message."""
-    pubkey_prefix = buf.read(6).hex()
-    path_len = buf.read(1)[0]
-    txt_type = buf.read(1)[0]
-    timestamp = int.from_bytes(buf.read(4), byteorder="little")
+    pubkey_prefix, path_len, txt_type, timestamp = _CONTACT_MSG.unpack_from(payload, 1)
 
     result = {
-        "from": pubkey_prefix,
+        "from": pubkey_prefix.hex(),
         "path_len": path_len,
         "timestamp": timestamp,
     }
 
+    offset = 13
     if txt_type == 2:
-        result["signature"] = buf.read(4).hex()
+        result["signature"] = payload[13:17].hex()
+        offset = 17
 
-    text = buf.read().decode("utf-8", "ignore")
+    text = payload[offset:].decode("utf-8", "ignore")
     result["text"] = text[:100] + "..." if len(text) > 100 else text
-    result["type"] = {0: "text", 1: "command", 2: "signed"}.get(txt_type, f"unknown({txt_type})")
+    result["type"] = _TXT_TYPES.get(txt_type, _UNKNOWN_NAMES[txt_type])
 
     return result
 
 
-def _decode_channel_msg(buf: io.BytesIO) -> dict[str, Any]:
+def _decode_channel_msg(payload: bytes) -> dict[str, Any]:
     """Decode a channel message."""
-    channel_idx = buf.read(1)[0]
-    path_len = buf.read(1)[0]
-    txt_type = buf.read(1)[0]
-    timestamp = int.from_bytes(buf.read(4), byteorder="little")
-    text = buf.read().decode("utf-8", "ignore")
+    channel_idx, path_len, txt_type, timestamp = _CHANNEL_MSG.unpack_from(payload, 1)
+    text = payload[8:].decode("utf-8", "ignore")
 
     return {
         "channel": channel_idx,
         "path_len": path_len,
         "timestamp": timestamp,
         "text": text[:100] + "..." if len(text) > 100 else text,
-        "type": {0: "text", 1: "command"}.get(txt_type, f"unknown({txt_type})"),
+        "type": _CHAN_TXT_TYPES.get(txt_type, _UNKNOWN_NAMES[txt_type]),
     }
 
 
 def _decode_stats(payload: bytes) -> dict[str, Any]:
     """Decode stats response."""
-    if len(payload) < 2:
-        return {}
-
     stats_type = payload[1]
+    layout = _STATS_DISPATCH.get(stats_type)
+    if layout is None or len(payload) < 2 + layout[0].size:
+        return {"stats_type": _UNKNOWN_NAMES[stats_type]}
+
+    fmt, label, fields = layout
+    result = {"stats_type": label, **dict(zip(fields, fmt.unpack_from(payload, 2), strict=True))}
+    if stats_type == 1:
+        result["last_snr"] /= 4.0  # SNR is reported in quarter-dB steps
+    return result
 
-    if stats_type == 0 and len(payload) >= 11:  # STATS_CORE
-        battery_mv, uptime_secs, errors, queue_len = struct.unpack("<HIHB", payload[2:11])
-        return {
-            "stats_type": "core",
-            "battery_mv": battery_mv,
-            "uptime_secs": uptime_secs,
-            "errors": errors,
-            "queue_len": queue_len,
-        }
-
-    elif stats_type == 1 and len(payload) >= 14:  # STATS_RADIO
-        noise_floor, last_rssi, last_snr_scaled, tx_air_secs, rx_air_secs = struct.unpack(
-            "<hbbII", payload[2:14]
-        )
-        return {
-            "stats_type": "radio",
-            "noise_floor": noise_floor,
-            "last_rssi": last_rssi,
-            "last_snr": last_snr_scaled / 4.0,
-            "tx_air_secs": tx_air_secs,
-            "rx_air_secs": rx_air_secs,
-        }
-
-    elif stats_type == 2 and len(payload) >= 26:  # STATS_PACKETS
-        recv, sent, flood_tx, direct_tx, flood_rx, direct_rx = struct.unpack(
-            "<IIIIII", payload[2:26]
-        )
-        return {
-            "stats_type": "packets",
-            "recv": recv,
-            "sent": sent,
-            "flood_tx": flood_tx,
-            "direct_tx": direct_tx,
-            "flood_rx": flood_rx,
-            "direct_rx": direct_rx,
-        }
-
-    return {"stats_type": f"unknown({stats_type})"}
+
+# Dispatch tables keyed by packet type byte
+_RESPONSE_HANDLERS: dict[int, Decoder] = {
+    0x00: _decode_ok,  # OK
+    0x01: _decode_error,  # ERROR
+    0x02: _u32_field("contact_count"),  # CONTACT_START
+    0x03: _decode_contact,  # CONTACT
+    0x04: _u32_field("lastmod"),  # CONTACT_END
+    0x05: _decode_self_info,  # SELF_INFO
+    0x06: _decode_msg_sent,  # MSG_SENT
+    0x07: _decode_contact_msg,  # CONTACT_MSG_RECV
+    0x08: _decode_channel_msg,  # CHANNEL_MSG_RECV
+    0x09: _u32_field("time"),  # CURRENT_TIME
+    0x0A: _decode_no_more_msgs,  # NO_MORE_MSGS
+    0x0B: _decode_contact_uri,  # CONTACT_URI
+    0x0C: _decode_battery,  # BATTERY
+    0x0D: _decode_device_info,  # DEVICE_INFO
+    0x12: _decode_channel_info,  # CHANNEL_INFO
+    0x15: _decode_custom_vars,  # CUSTOM_VARS
+    0x18: _decode_stats,  # STATS (24)
+    0x80: _decode_public_key,  # ADVERTISEMENT
+    0x81: _decode_public_key,  # PATH_UPDATE
+    0x82: _decode_ack,  # ACK
+    0x83: _decode_messages_waiting,  # MESSAGES_WAITING
+    0x85: _decode_login_success,  # LOGIN_SUCCESS
+    0x86: _decode_login_failed,  # LOGIN_FAILED
+    0x87: _decode_status_response,  # STATUS_RESPONSE
+    0x8A: _decode_contact,  # NEW_ADVERT
+    0x8B: _decode_telemetry_response,  # TELEMETRY_RESPONSE
+    0x8C: _decode_binary_response,  # BINARY_RESPONSE
+}
+
+_COMMAND_HANDLERS: dict[int, Decoder] = {
+    0x01: _decode_cmd_appstart,  # APPSTART
+    0x02: _decode_cmd_send_msg,  # SEND_MSG
+    0x03: _decode_cmd_send_chan_msg,  # SEND_CHAN_MSG
+    0x04: _decode_cmd_get_contacts,  # GET_CONTACTS
+    0x06: _u32_field("time"),  # SET_TIME
+    0x08: _decode_cmd_set_name,  # SET_NAME
+    0x0B: _decode_cmd_set_radio,  # SET_RADIO
+    0x0C: _u32_field("tx_power"),  # SET_TX_POWER
+    0x0E: _decode_cmd_set_coords,  # SET_COORDS
+    0x16: _decode_cmd_device_query,  # DEVICE_QUERY
+    0x1A: _decode_cmd_send_login,  # SEND_LOGIN
+    0x1F: _decode_cmd_get_channel,  # GET_CHANNEL
+    0x20: _decode_cmd_set_channel,  # SET_CHANNEL
+    0x25: _u32_field("pin"),  # SET_DEVICE_PIN
+    0x27: _decode_cmd_get_telemetry,  # GET_TELEMETRY
+    0x34: _decode_cmd_path_discovery,  # PATH_DISCOVERY
+    0x38: _decode_cmd_get_stats,  # GET_STATS
+}
+
+# Minimum payload length (including the type byte) each handler needs, derived
+# from the fixed part of its layout. Types not listed only need the type byte.
+_RESPONSE_MIN_LEN: dict[int, int] = {
+    0x02: 5,  # CONTACT_START
+    0x03: 1 + _CONTACT_HDR.size + 64 + 32 + _CONTACT_TAIL.size,  # CONTACT
+    0x04: 5,  # CONTACT_END
+    0x05: 1 + _SELF_INFO.size,  # SELF_INFO
+    0x06: 1 + _MSG_SENT.size,  # MSG_SENT
+    0x07: 1 + _CONTACT_MSG.size,  # CONTACT_MSG_RECV
+    0x08: 1 + _CHANNEL_MSG.size,  # CHANNEL_MSG_RECV
+    0x09: 5,  # CURRENT_TIME
+    0x0C: 3,  # BATTERY
+    0x0D: 2,  # DEVICE_INFO
+    0x12: 2,  # CHANNEL_INFO
+    0x18: 2,  # STATS
+    0x80: 33,  # ADVERTISEMENT
+    0x81: 33,  # PATH_UPDATE
+    0x8A: 1 + _CONTACT_HDR.size + 64 + 32 + _CONTACT_TAIL.size,  # NEW_ADVERT
+    0x8B: 1 + _TELEMETRY_RESPONSE.size,  # TELEMETRY_RESPONSE
+    0x8C: 1 + _BINARY_RESPONSE.size,  # BINARY_RESPONSE
+}
+
+_COMMAND_MIN_LEN: dict[int, int] = {
+    0x01: 3,  # APPSTART
+    0x02: 1 + _SEND_MSG.size,  # SEND_MSG
+    0x03: 1 + _SEND_CHAN_MSG.size,  # SEND_CHAN_MSG
+    0x06: 5,  # SET_TIME
+    0x0B: 1 + _SET_RADIO.size,  # SET_RADIO
+    0x0C: 5,  # SET_TX_POWER
+    0x0E: 1 + _COORDS.size,  # SET_COORDS
+    0x1A: 33,  # SEND_LOGIN
+    0x1F: 2,  # GET_CHANNEL
+    0x20: 2,  # SET_CHANNEL
+    0x25: 5,  # SET_DEVICE_PIN
+    0x34: 34,  # PATH_DISCOVERY
+    0x38: 2,  # GET_STATS
+}
+
+
+def _with_min_len(handler: Decoder, min_len: int) -> Decoder:
+    """Wrap a handler so it returns None for payloads shorter than min_len."""
+
+    def decode(payload: bytes) -> Optional[dict[str, Any]]:
+        if len(payload) < min_len:
+            return None
+        return handler(payload)
+
+    return decode
+
+
+def _decoder_table(
+    handlers: dict[int, Decoder], min_len: dict[int, int]
+) -> tuple[Optional[Decoder], ...]:
+    """Expand a dispatch dict into a 256-entry table indexed by the type byte."""
+    table: list[Optional[Decoder]] = [None] * 256
+    for packet_type, handler in handlers.items():
+        needed = min_len.get(packet_type, 1)
+        table[packet_type] = handler if needed <= 1 else _with_min_len(handler, needed)
+    return tuple(table)
+
+
+# Per-type decoders taking just the payload, for callers that already have the type
+# byte in hand. The payload must start with that byte (so it is never empty); None
+# means the type isn't decoded.
+RESPONSE_DECODERS: tuple[Optional[Decoder], ...] = _decoder_table(
+    _RESPONSE_HANDLERS, _RESPONSE_MIN_LEN
+)
+COMMAND_DECODERS: tuple[Optional[Decoder], ...] = _decoder_table(
+    _COMMAND_HANDLERS, _COMMAND_MIN_LEN
+)
 
 
 def format_decoded(decoded: dict[str, Any]) -> str:
@@ -423,19 +523,27 @@ def format_decoded(decoded: dict[str, Any]) -> str:
         return ""
 
     parts = []
+    append = parts.append
     for key, value in decoded.items():
         if value is None:
             continue
         if isinstance(value, bool):
             if value:
-                parts.append(key)
+                append(key)
         elif isinstance(value, float):
-            parts.append(f"{key}={value:.2f}")
+            append(key + "=" + format(value, ".2f"))
         elif isinstance(value, dict):
             # Nested dict (like vars)
-            inner = ", ".join(f"{k}={v}" for k, v in value.items())
-            parts.append(f"{key}={{{inner}}}")
+            append(key + "={" + _format_nested(value) + "}")
         else:
-            parts.append(f"{key}={value}")
+            append(key + "=" + str(value))
 
     return " | ".join(parts)
+
+
+def _format_nested(values: dict[str, Any]) -> str:
+    """Format a nested dict as comma-separated key=value pairs."""
+    parts = []
+    for key, value in values.items():
+        parts.append(key + "=" + str(value))
+    return ", ".join(parts)
@@ -1,15 +1,17 @@
 """MeshCore TCP Proxy implementation."""
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import struct
 import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Optional
 
-from .decoder import decode_command, decode_response, format_decoded
+from .decoder import COMMAND_DECODERS, RESPONSE_DECODERS, Decoder, format_decoded
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +21,55 @@ try:
     from meshcore.ble_cx import BLEConnection
     from meshcore.packets import PacketType
 except ImportError:
-    # Fall back to submodule path for development
-    submodule_path = os.path.join(
-        os.path.dirname(__file__), "..", "..", "..", "meshcore_py", "src"
+    # Fall back to submodule path for development (set MESHCORE_PROXY_SKIP_FALLBACK
+    # to fail fast instead of touching sys.path)
+    if os.environ.get("MESHCORE_PROXY_SKIP_FALLBACK"):
+        raise
+    submodule_path = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "..", "..", "meshcore_py", "src")
     )
-    sys.path.insert(0, os.path.abspath(submodule_path))
+    if submodule_path not in sys.path:
+        sys.path.insert(0, submodule_path)
     from meshcore.serial_cx import SerialConnection
     from meshcore.ble_cx import BLEConnection
     from meshcore.packets import PacketType
 
 
+def _dumps_json_stdlib(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Serialize JSON event logs with orjson when it is installed (the "speedups" extra).
+# Both paths produce equivalent compact JSON (same keys and values), but number
+# formatting may differ, e.g. orjson writes 1e-6 where the stdlib writes 1e-06.
+try:
+    import orjson
+
+    def _dumps_json(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _dumps_json = _dumps_json_stdlib
+
+
+# TCP frame header: 0x3c marker + 2-byte little-endian payload size
+_FRAME_HDR = struct.Struct("<BH")
+
+# Maximum number of event log lines buffered for the writer task
+EVENT_LOG_QUEUE_SIZE = 1000
+
+# Per-client transport write buffer limits; a client whose unsent data exceeds
+# the high-water mark is disconnected rather than buffered without bound
+CLIENT_WRITE_HIGH_WATER = 256 * 1024
+CLIENT_WRITE_LOW_WATER = 64 * 1024
+
+# Frames read from a client but not yet sent to the radio before we stop reading from it
+CLIENT_PENDING_FRAMES = 64
+
+# Largest possible client frame (3-byte header + 16-bit size), so one always fits the read buffer
+_MAX_FRAME_SIZE = _FRAME_HDR.size + 0xFFFF
+
+
 class EventLogLevel(Enum):
     """Event logging verbosity levels."""
 
@@ -91,19 +132,128 @@ COMMAND_TYPE_NAMES = {
 }
 
 
+def _name_table(names: dict[int, str], unknown_prefix: str) -> tuple[str, ...]:
+    """Expand a sparse type name map into a 256-entry table indexed by the type byte."""
+    return tuple(
+        names.get(value, f"{unknown_prefix}_UNKNOWN(0x{value:02x})") for value in range(256)
+    )
+
+
+@dataclass(frozen=True)
+class _EventDirection:
+    """Everything the event loggers need to describe packets in one direction."""
+
+    # Name for every packet type byte, including the unknown ones
+    type_names: tuple[str, ...]
+    # Start of a text event log line for every packet type byte, e.g. "-> CMD_GET_TIME"
+    line_heads: tuple[str, ...]
+    # Payload decoder for every packet type byte, None where there are no details
+    decoders: tuple[Optional[Decoder], ...]
+    # Pre-serialized start of a JSON event log line, up to the packet type name
+    json_prefix: str
+
+
+_COMMAND_NAME_TABLE = _name_table(COMMAND_TYPE_NAMES, "CMD")
+_RESPONSE_NAME_TABLE = _name_table(RESPONSE_TYPE_NAMES, "RESP")
+
+_TO_RADIO = _EventDirection(
+    type_names=_COMMAND_NAME_TABLE,
+    line_heads=tuple("-> " + name for name in _COMMAND_NAME_TABLE),
+    decoders=COMMAND_DECODERS,
+    json_prefix='{"direction":"TO_RADIO","packet_type":"',
+)
+
+_FROM_RADIO = _EventDirection(
+    type_names=_RESPONSE_NAME_TABLE,
+    line_heads=tuple("<- " + name for name in _RESPONSE_NAME_TABLE),
+    decoders=RESPONSE_DECODERS,
+    json_prefix='{"direction":"FROM_RADIO","packet_type":"',
+)
+
+
 @dataclass
 class TCPClient:
     """Represents a connected TCP client."""
 
-    reader: asyncio.StreamReader
-    writer: asyncio.StreamWriter
+    transport: asyncio.Transport
     addr: tuple
+    # Set while the transport's write buffer is above the high-water mark
+    write_paused: bool = False
+
+
+class _ClientProtocol(asyncio.BufferedProtocol):
+    """
+    Protocol for one TCP client connection.
+
+    Incoming data is read straight into a reusable per-connection buffer and
+    complete frames are parsed out of it in place. Payloads are handed to a
+    per-connection sender task so they reach the radio in the order received.
+    """
 
-    # Frame parsing state (same as meshcore_py TCP connection)
-    frame_started: bool = False
-    frame_size: int = 0
-    header: bytes = b""
-    inframe: bytes = b""
+    def __init__(self, proxy: "MeshCoreProxy") -> None:
+        self._proxy = proxy
+        self._buffer = bytearray(_MAX_FRAME_SIZE)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self._client: Optional[TCPClient] = None
+        self._pending: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        self._reading_paused = False
+        self._sender: Optional[asyncio.Task] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        transport.set_write_buffer_limits(high=CLIENT_WRITE_HIGH_WATER, low=CLIENT_WRITE_LOW_WATER)
+        self._client = TCPClient(transport=transport, addr=transport.get_extra_info("peername"))
+        self._proxy._add_client(self._client)
+        self._sender = asyncio.create_task(self._run_sender())
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._view[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        used = self._used + nbytes
+        view = self._view
+        start = 0
+        # Same framing as meshcore_py: 0x3c + 2-byte little-endian size + payload
+        while used - start >= 3:
+            end = start + 3 + (view[start + 1] | view[start + 2] << 8)
+            if end > used:
+                break
+            # Copied out, since the buffer is reused for the next read
+            self._pending.put_nowait(bytes(view[start + 3 : end]))
+            start = end
+
+        # Move any partial frame to the front of the buffer
+        if start:
+            self._buffer[: used - start] = self._buffer[start:used]
+        self._used = used - start
+
+        if not self._reading_paused and self._pending.qsize() >= CLIENT_PENDING_FRAMES:
+            self._reading_paused = True
+            self._client.transport.pause_reading()
+
+    def pause_writing(self) -> None:
+        self._client.write_paused = True
+
+    def resume_writing(self) -> None:
+        self._client.write_paused = False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is not None:
+            logger.debug(f"Client {self._client.addr} connection lost: {exc}")
+        self._proxy._remove_client(self._client)
+        # Let the sender finish the frames already received, then stop
+        self._pending.put_nowait(None)
+
+    async def _run_sender(self) -> None:
+        """Forward received payloads to the radio, one at a time."""
+        while True:
+            payload = await self._pending.get()
+            if payload is None:
+                return
+            await self._proxy._send_to_radio(payload)
+            if self._reading_paused and self._pending.qsize() < CLIENT_PENDING_FRAMES:
+                self._reading_paused = False
+                self._client.transport.resume_reading()
 
 
 class MeshCoreProxy:
@@ -131,16 +281,62 @@ class MeshCoreProxy:
         self.ble_pin = ble_pin
         self.tcp_host = tcp_host
         self.tcp_port = tcp_port
+        self._event_log_json = event_log_json
         self.event_log_level = event_log_level
-        self.event_log_json = event_log_json
 
         self._radio_connection: Optional[SerialConnection | BLEConnection] = None
         self._tcp_server: Optional[asyncio.Server] = None
         self._clients: dict[tuple, TCPClient] = {}
+        # Same clients as _clients, kept as a list for the broadcast loop
+        self._client_list: list[TCPClient] = []
         self._is_ble = False
         self._is_running = False
         self._radio_connected = False
 
+        # Event log lines are handed to a writer task so stdout writes don't block the radio path
+        self._log_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=EVENT_LOG_QUEUE_SIZE)
+        self._log_writer_task: Optional[asyncio.Task] = None
+        self._log_lines_dropped = 0
+
+    @property
+    def event_log_level(self) -> EventLogLevel:
+        """Event logging verbosity."""
+        return self._event_log_level
+
+    @event_log_level.setter
+    def event_log_level(self, level: EventLogLevel) -> None:
+        self._event_log_level = level
+        self._update_event_logger()
+
+    @property
+    def event_log_json(self) -> bool:
+        """Whether event logs are emitted as JSON."""
+        return self._event_log_json
+
+    @event_log_json.setter
+    def event_log_json(self, enabled: bool) -> None:
+        self._event_log_json = enabled
+        self._update_event_logger()
+
+    def _update_event_logger(self) -> None:
+        """Select the event logger implementation for the current log settings."""
+        # Cached as plain flags so the per-packet logging path avoids enum comparisons
+        self._logging_enabled = self._event_log_level != EventLogLevel.OFF
+        self._event_log_verbose = self._event_log_level == EventLogLevel.VERBOSE
+
+        if not self._logging_enabled:
+            log_event = self._log_event_off
+        elif self._event_log_json:
+            log_event = self._log_event_json
+        elif self._event_log_verbose:
+            log_event = self._log_event_verbose
+        else:
+            log_event = self._log_event_summary
+
+        # Bind the direction up front so callers don't pass or compare it per packet
+        self._log_event_to_radio = functools.partial(log_event, _TO_RADIO)
+        self._log_event_from_radio = functools.partial(log_event, _FROM_RADIO)
+
     async def _handle_radio_disconnect(self, reason: Optional[str] = None) -> None:
         """Handle radio disconnection."""
         if self._radio_connected:
@@ -150,84 +346,167 @@ class MeshCoreProxy:
             else:
                 logger.warning("Radio disconnected.")
 
-    def _log_event(
+    def _describe_event(
         self,
-        direction: str,
+        direction: _EventDirection,
         packet_type: int,
         payload: bytes,
+    ) -> tuple[str, Optional[dict[str, Any]]]:
+        """Return the packet type name and decoded payload for an event."""
+        type_name = direction.type_names[packet_type]
+        decode = direction.decoders[packet_type]
+        if decode is None:
+            return type_name, None
+        return type_name, decode(payload)
+
+    def _format_event(self, direction: _EventDirection, packet_type: int, payload: bytes) -> str:
+        """Return the decoded payload of an event as a summary string, or "" if none."""
+        decode = direction.decoders[packet_type]
+        if decode is None:
+            return ""
+        decoded = decode(payload)
+        return format_decoded(decoded) if decoded else ""
+
+    def _log_event_off(self, direction: _EventDirection, packet_type: int, payload: bytes) -> None:
+        """Discard an event (event logging is off)."""
+
+    def _log_event_json(self, direction: _EventDirection, packet_type: int, payload: bytes) -> None:
+        """Log an event as a JSON object."""
+        type_name, decoded = self._describe_event(direction, packet_type, payload)
+        # Only the decoded dict goes through the JSON encoder; the fixed fields are
+        # spliced in as text (type names are plain ASCII identifiers)
+        parts = [
+            direction.json_prefix,
+            type_name,
+            '","packet_type_raw":',
+            str(packet_type),
+        ]
+        if decoded:
+            parts += (',"decoded":', _dumps_json(decoded))
+        if self._event_log_verbose:
+            parts += (',"payload_hex":"', payload.hex(), '","payload_len":', str(len(payload)))
+        parts.append("}")
+        self._emit("".join(parts))
+
+    def _log_event_summary(
+        self, direction: _EventDirection, packet_type: int, payload: bytes
     ) -> None:
-        """Log a MeshCore event based on configured verbosity."""
-        if self.event_log_level == EventLogLevel.OFF:
-            return
-
-        # Get human-readable packet type name based on direction
-        if direction == "TO_RADIO":
-            # Commands going to the radio
-            type_name = COMMAND_TYPE_NAMES.get(packet_type, f"CMD_UNKNOWN(0x{packet_type:02x})")
-            decoded = decode_command(packet_type, payload)
+        """Log an event as a one-line summary."""
+        head = direction.line_heads[packet_type]
+        decoded_str = self._format_event(direction, packet_type, payload)
+        if decoded_str:
+            self._emit(f"{head}: {decoded_str}")
         else:
-            # Responses coming from the radio
-            type_name = RESPONSE_TYPE_NAMES.get(packet_type, f"RESP_UNKNOWN(0x{packet_type:02x})")
-            decoded = decode_response(packet_type, payload)
-
-        # Format decoded data
-        decoded_str = format_decoded(decoded) if decoded else ""
-
-        if self.event_log_json:
-            log_data = {
-                "direction": direction,
-                "packet_type": type_name,
-                "packet_type_raw": packet_type,
-            }
-            if decoded:
-                log_data["decoded"] = decoded
-            if self.event_log_level == EventLogLevel.VERBOSE:
-                log_data["payload_hex"] = payload.hex()
-                log_data["payload_len"] = len(payload)
-            print(json.dumps(log_data), flush=True)
+            self._emit(head)
+
+    def _log_event_verbose(
+        self, direction: _EventDirection, packet_type: int, payload: bytes
+    ) -> None:
+        """Log an event with its decoded fields and raw payload."""
+        head = direction.line_heads[packet_type]
+        decoded_str = self._format_event(direction, packet_type, payload)
+        if decoded_str:
+            self._emit(f"{head}: {decoded_str}")
+            self._emit(f"   [{len(payload)} bytes]: {payload.hex()}")
         else:
-            arrow = "->" if direction == "TO_RADIO" else "<-"
-            if self.event_log_level == EventLogLevel.SUMMARY:
-                if decoded_str:
-                    print(f"{arrow} {type_name}: {decoded_str}", flush=True)
-                else:
-                    print(f"{arrow} {type_name}", flush=True)
-            else:  # VERBOSE
-                if decoded_str:
-                    print(f"{arrow} {type_name}: {decoded_str}", flush=True)
-                    print(f"   [{len(payload)} bytes]: {payload.hex()}", flush=True)
-                else:
-                    print(f"{arrow} {type_name} [{len(payload)} bytes]: {payload.hex()}", flush=True)
+            self._emit(f"{head} [{len(payload)} bytes]: {payload.hex()}")
+
+    def _emit(self, line: str) -> None:
+        """Queue an event log line for the writer task, or print it if no writer is running."""
+        if self._log_writer_task is None or self._log_writer_task.done():
+            print(line, flush=True)
+            return
+
+        if self._log_queue.full():
+            # Drop the oldest line rather than hold up packet forwarding
+            self._log_queue.get_nowait()
+            self._log_lines_dropped += 1
+        self._log_queue.put_nowait(line)
+
+    def _write_log_batch(self, lines: list[str]) -> None:
+        """Write a batch of event log lines to stdout with a single flush."""
+        if self._log_lines_dropped:
+            logger.warning(f"Dropped {self._log_lines_dropped} event log lines")
+            self._log_lines_dropped = 0
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def _drain_log_queue(self) -> list[str]:
+        """Take every line currently waiting in the event log queue."""
+        lines = []
+        while not self._log_queue.empty():
+            lines.append(self._log_queue.get_nowait())
+        return lines
+
+    async def _run_log_writer(self) -> None:
+        """Write queued event log lines, batching whatever has accumulated."""
+        while True:
+            lines = [await self._log_queue.get()]
+            lines.extend(self._drain_log_queue())
+            try:
+                self._write_log_batch(lines)
+            except Exception as e:
+                # Keep the writer alive (e.g. stdout is a closed pipe) so logging can't
+                # fill the queue and start dropping lines silently
+                logger.error(f"Failed to write event log lines: {e}")
+
+    async def _stop_log_writer(self) -> None:
+        """Stop the writer task and flush any lines still queued."""
+        if self._log_writer_task is None:
+            return
+
+        self._log_writer_task.cancel()
+        try:
+            await self._log_writer_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Event log writer failed: {e}")
+        self._log_writer_task = None
+
+        lines = self._drain_log_queue()
+        if lines:
+            try:
+                self._write_log_batch(lines)
+            except Exception as e:
+                logger.error(f"Failed to write event log lines: {e}")
 
     def _frame_payload(self, payload: bytes) -> bytes:
         """Frame a payload for TCP transmission (0x3c + 2-byte size + payload)."""
-        size = len(payload)
-        return b"\x3c" + size.to_bytes(2, byteorder="little") + payload
+        return _FRAME_HDR.pack(0x3C, len(payload)) + payload
 
     async def _handle_radio_rx(self, payload: bytes) -> None:
         """Handle data received from the radio - forward to all TCP clients."""
         if not self._radio_connected or not payload:
             return
 
-        # Log the event
-        packet_type = payload[0] if payload else 0
-        self._log_event("FROM_RADIO", packet_type, payload)
+        # Log the event (skipped entirely, including decoding, when logging is off)
+        if self._logging_enabled:
+            self._log_event_from_radio(payload[0], payload)
 
-        # Frame and forward to all TCP clients
+        # Frame and forward to all TCP clients. Writes go straight to each transport's
+        # buffer; a client still over the high-water mark is dropped instead. The frame
+        # is built once and the same bytes object is handed to every transport, so
+        # don't copy or re-frame it per client.
         framed = self._frame_payload(payload)
         disconnected = []
 
-        for addr, client in self._clients.items():
+        for client in self._client_list:
+            if client.write_paused:
+                logger.warning(f"Client {client.addr} is not keeping up, disconnecting")
+                disconnected.append(client)
+                continue
             try:
-                client.writer.write(framed)
-                await client.writer.drain()
+                client.transport.write(framed)
             except Exception as e:
-                logger.warning(f"Failed to forward to client {addr}: {e}")
-                disconnected.append(addr)
+                logger.warning(f"Failed to forward to client {client.addr}: {e}")
+                disconnected.append(client)
 
-        # Clean up disconnected clients
-        for addr in disconnected:
-            await self._remove_client(addr)
+        # Clean up disconnected clients. Abort rather than close, and never wait for the
+        # close here: a stalled peer never drains its buffer, so an orderly close would
+        # not finish and would hold up radio RX with it
+        for client in disconnected:
+            self._remove_client(client, abort=True)
 
     async def _send_to_radio(self, payload: bytes) -> None:
         """Send a payload to the radio."""
@@ -236,9 +515,10 @@ class MeshCoreProxy:
             return
 
         try:
-            # Log the event
-            packet_type = payload[0] if payload else 0
-            self._log_event("TO_RADIO", packet_type, payload)
+            # Log the event (empty frames from clients are still forwarded, so keep the guard)
+            if self._logging_enabled:
+                packet_type = payload[0] if payload else 0
+                self._log_event_to_radio(packet_type, payload)
 
             # BLE sends raw payload, Serial/TCP adds framing
             if self._is_ble:
@@ -249,91 +529,28 @@ class MeshCoreProxy:
             logger.error(f"Failed to send to radio: {e}")
             await self._handle_radio_disconnect()
 
-    def _parse_tcp_frame(self, client: TCPClient, data: bytes) -> list[bytes]:
+    def _add_client(self, client: TCPClient) -> None:
+        """Register a newly connected client."""
+        self._clients[client.addr] = client
+        self._client_list.append(client)
+        logger.info(f"Client connected: {client.addr}")
+
+    def _remove_client(self, client: TCPClient, abort: bool = False) -> None:
         """
-        Parse incoming TCP data into complete frames.
-        Returns list of complete payloads (without frame headers).
-        Uses same framing logic as meshcore_py.
+        Remove a client and close its connection.
+
+        With abort=True the connection is dropped without flushing pending writes,
+        which is needed for a client that has stopped reading: close() would wait
+        for its write buffer to drain and never finish.
         """
-        payloads = []
-        offset = 0
-
-        while offset < len(data):
-            remaining = data[offset:]
-
-            if not client.frame_started:
-                # Need 3-byte header: 0x3c + 2-byte size
-                header_needed = 3 - len(client.header)
-                if len(remaining) >= header_needed:
-                    client.header = client.header + remaining[:header_needed]
-                    client.frame_started = True
-                    client.frame_size = int.from_bytes(client.header[1:], byteorder="little")
-                    offset += header_needed
-                else:
-                    client.header = client.header + remaining
-                    break
+        if client in self._client_list:
+            self._client_list.remove(client)
+            self._clients.pop(client.addr, None)
+            if abort:
+                client.transport.abort()
             else:
-                # Accumulate frame data
-                frame_needed = client.frame_size - len(client.inframe)
-                if len(remaining) >= frame_needed:
-                    client.inframe = client.inframe + remaining[:frame_needed]
-                    payloads.append(client.inframe)
-
-                    # Reset for next frame
-                    client.frame_started = False
-                    client.header = b""
-                    client.inframe = b""
-                    offset += frame_needed
-                else:
-                    client.inframe = client.inframe + remaining
-                    break
-
-        return payloads
-
-    async def _remove_client(self, addr: tuple) -> None:
-        """Remove a client and close its connection."""
-        if addr in self._clients:
-            client = self._clients.pop(addr)
-            try:
-                client.writer.close()
-                await client.writer.wait_closed()
-            except Exception:
-                pass
-            logger.info(f"Client disconnected: {addr}")
-
-    async def _handle_tcp_client(
-        self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
-    ) -> None:
-        """Handle a TCP client connection."""
-        addr = writer.get_extra_info("peername")
-        logger.info(f"Client connected: {addr}")
-
-        client = TCPClient(reader=reader, writer=writer, addr=addr)
-        self._clients[addr] = client
-
-        try:
-            while True:
-                data = await reader.read(4096)
-                if not data:
-                    break
-
-                # Parse frames from the TCP data
-                payloads = self._parse_tcp_frame(client, data)
-
-                # Forward each complete payload to the radio
-                for payload in payloads:
-                    await self._send_to_radio(payload)
-
-        except asyncio.CancelledError:
-            pass
-        except ConnectionResetError:
-            logger.debug(f"Client {addr} connection reset")
-        except Exception as e:
-            logger.error(f"Error handling client {addr}: {e}")
-        finally:
-            await self._remove_client(addr)
+                client.transport.close()
+            logger.info(f"Client disconnected: {client.addr}")
 
     async def _connect_radio(self) -> None:
         """Connect to the MeshCore radio."""
@@ -377,8 +594,9 @@ class MeshCoreProxy:
 
     async def _start_tcp_server(self) -> None:
         """Start the TCP server."""
-        self._tcp_server = await asyncio.start_server(
-            self._handle_tcp_client,
+        loop = asyncio.get_running_loop()
+        self._tcp_server = await loop.create_server(
+            lambda: _ClientProtocol(self),
             self.tcp_host,
             self.tcp_port,
         )
@@ -393,6 +611,7 @@ class MeshCoreProxy:
         logger.info(f"Starting MeshCore Proxy ({conn_type}: {conn_target})...")
 
         await self._start_tcp_server()
+        self._log_writer_task = asyncio.create_task(self._run_log_writer())
 
         reconnect_delay = 5  # Initial delay in seconds
         max_delay = 300  # 5 minutes
@@ -426,8 +645,8 @@ class MeshCoreProxy:
         self._is_running = False
 
         # Close all clients
-        for addr in list(self._clients.keys()):
-            await self._remove_client(addr)
+        for client in list(self._client_list):
+            self._remove_client(client)
 
         # Stop TCP server
         if self._tcp_server:
@@ -439,3 +658,5 @@ class MeshCoreProxy:
             await self._radio_connection.disconnect()
         
         self._radio_connected = False
+
+        await self._stop_log_writer()
@@ -1,8 +1,11 @@
 """Tests for CLI signal handling."""
 
 import asyncio
+import importlib
 import os
 import signal
+import sys
+import types
 from unittest.mock import patch
 
 import pytest
@@ -114,3 +117,16 @@ async def test_sigint_triggers_graceful_shutdown(mock_serial_connection):
 
     # Verify proxy stopped cleanly
     assert not proxy._is_running
+
+
+def test_old_uvloop_falls_back_to_asyncio_run():
+    """Test that a uvloop without run() (older than 0.18) doesn't break the CLI import."""
+    import meshcore_proxy.cli as cli
+
+    old_uvloop = types.ModuleType("uvloop")
+    try:
+        with patch.dict(sys.modules, {"uvloop": old_uvloop}):
+            importlib.reload(cli)
+            assert cli._run is asyncio.run
+    finally:
+        importlib.reload(cli)
@@ -0,0 +1,161 @@
+"""Tests for the MeshCore payload decoder."""
+
+import struct
+
+from meshcore_proxy.decoder import (
+    COMMAND_DECODERS,
+    RESPONSE_DECODERS,
+    decode_command,
+    decode_response,
+    format_decoded,
+)
+
+
+def _contact_payload(packet_type=0x03, name=b"Alice", contact_type=1, lat=47.5, lon=-122.25):
+    """Build a CONTACT / NEW_ADVERT payload."""
+    return (
+        bytes([packet_type])
+        + bytes(range(32))  # public key
+        + bytes([contact_type, 0x00, 0xFF])  # type, flags, path_len (-1)
+        + bytes(64)  # path
+        + name.ljust(32, b"\0")
+        + struct.pack("<Iii", 1700000000, int(lat * 1e6), int(lon * 1e6))
+    )
+
+
+def test_decode_ok_and_error():
+    """Test the simple status responses."""
+    assert decode_response(0x00, b"\x00") == {"status": "OK"}
+    assert decode_response(0x00, b"\x00\x2a\x00\x00\x00") == {"status": "OK", "value": 42}
+    assert decode_response(0x01, b"\x01\x03") == {"status": "ERROR", "error_code": 3}
+
+
+def test_decode_contact():
+    """Test that CONTACT and NEW_ADVERT records decode identically."""
+    expected = {
+        "name": "Alice",
+        "public_key": "000102030405...",
+        "type": "repeater",
+        "path_len": -1,
+        "last_advert": 1700000000,
+        "lat": 47.5,
+        "lon": -122.25,
+    }
+    assert decode_response(0x03, _contact_payload(0x03)) == expected
+    assert decode_response(0x8A, _contact_payload(0x8A)) == expected
+
+
+def test_decode_contact_without_location():
+    """Test that a zero location is reported as None."""
+    decoded = decode_response(0x03, _contact_payload(contact_type=7, lat=0, lon=0))
+    assert decoded["type"] == "unknown(7)"
+    assert decoded["lat"] is None
+    assert decoded["lon"] is None
+
+
+def test_decode_msg_sent_and_battery():
+    """Test fixed-layout responses with multiple fields."""
+    assert decode_response(0x06, b"\x06\x01\xde\xad\xbe\xef\x10\x27\x00\x00") == {
+        "msg_type": 1,
+        "expected_ack": "deadbeef",
+        "timeout_ms": 10000,
+    }
+    assert decode_response(0x0C, b"\x0c\xfc\x10") == {"level_mv": 4348}
+    assert decode_response(0x0C, b"\x0c\xfc\x10" + struct.pack("<II", 22, 100)) == {
+        "level_mv": 4348,
+        "used_kb": 22,
+        "total_kb": 100,
+    }
+
+
+def test_decode_contact_msg():
+    """Test decoding of a signed direct message."""
+    payload = (
+        b"\x07"
+        + bytes.fromhex("a1b2c3d4e5f6")
+        + bytes([2, 2])  # path_len, txt_type (signed)
+        + struct.pack("<I", 1234)
+        + bytes.fromhex("01020304")
+        + b"hello"
+    )
+    assert decode_response(0x07, payload) == {
+        "from": "a1b2c3d4e5f6",
+        "path_len": 2,
+        "timestamp": 1234,
+        "signature": "01020304",
+        "text": "hello",
+        "type": "signed",
+    }
+
+
+def test_decode_stats():
+    """Test decoding of each stats sub-type."""
+    core = b"\x18\x00" + struct.pack("<HIHB", 4100, 3600, 2, 1)
+    assert decode_response(0x18, core) == {
+        "stats_type": "core",
+        "battery_mv": 4100,
+        "uptime_secs": 3600,
+        "errors": 2,
+        "queue_len": 1,
+    }
+    radio = b"\x18\x01" + struct.pack("<hbbII", -110, -80, 22, 5, 6)
+    assert decode_response(0x18, radio)["last_snr"] == 5.5
+    assert decode_response(0x18, b"\x18\x09") == {"stats_type": "unknown(9)"}
+
+
+def test_decode_custom_vars():
+    """Test parsing of the key:value list."""
+    assert decode_response(0x15, b"\x15gps:1,mode:a:b,junk") == {
+        "vars": {"gps": "1", "mode": "a:b"}
+    }
+    assert decode_response(0x15, b"\x15") == {"vars": {}}
+
+
+def test_decode_commands():
+    """Test decoding of commands sent to the radio."""
+    assert decode_command(0x01, b"\x01\x03mccli") == {"version": 3, "app": "mccli"}
+    assert decode_command(0x1A, b"\x1a" + bytes(range(32)) + b"secret") == {
+        "to": "000102030405...",
+        "password": "***",
+    }
+    assert decode_command(0x0E, b"\x0e" + struct.pack("<ii", 1500000, -2500000)) == {
+        "lat": 1.5,
+        "lon": -2.5,
+    }
+    assert decode_command(0x38, b"\x38\x01") == {"stats_type": "radio"}
+
+
+def test_unknown_and_truncated_packets():
+    """Test that unknown or truncated packets do not raise."""
+    assert decode_response(0x42, b"\x42\x00") is None
+    assert decode_command(0x05, b"\x05") is None
+    assert decode_response(0x00, b"") is None
+    assert decode_response(0x06, b"\x06\x01\xde\xad") is None
+    assert decode_command(0x0B, b"\x0b\x00") is None
+    for packet_type in range(256):
+        for length in range(1, 160):
+            for fill in (0x00, 0xFF):
+                payload = bytes([packet_type]) + bytes([fill]) * (length - 1)
+                decode_response(packet_type, payload)
+                decode_command(packet_type, payload)
+
+
+def test_format_decoded():
+    """Test the human-readable summary string."""
+    decoded = {"a": 1, "b": None, "c": True, "d": False, "e": 1.234, "f": {"x": "y", "z": 2}}
+    assert format_decoded(decoded) == "a=1 | c | e=1.23 | f={x=y, z=2}"
+    assert format_decoded({}) == ""
+
+
+def test_decoder_tables_match_decode_functions():
+    """Test that the per-type decoder tables agree with decode_response/decode_command."""
+    for packet_type in range(256):
+        for length in (1, 2, 5, 40, 160):
+            payload = bytes([packet_type]) + bytes(range(1, length))
+            for table, decode in (
+                (RESPONSE_DECODERS, decode_response),
+                (COMMAND_DECODERS, decode_command),
+            ):
+                decoder = table[packet_type]
+                expected = decode(packet_type, payload)
+                assert (decoder(payload) if decoder else None) == expected
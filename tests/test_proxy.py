@@ -1,8 +1,16 @@
 import asyncio
+import json
+import socket
 from unittest.mock import patch
 
 import pytest
-from meshcore_proxy.proxy import EventLogLevel, MeshCoreProxy
+from meshcore_proxy.proxy import (
+    EventLogLevel,
+    MeshCoreProxy,
+    _ClientProtocol,
+    _dumps_json,
+    _dumps_json_stdlib,
+)
 
 
 class MockRadio:
@@ -132,3 +140,291 @@ async def test_backoff_delay(mock_serial_connection):
         await proxy_task
     except asyncio.CancelledError:
         pass
+
+
+def test_event_log_summary(capsys):
+    """
+    Tests that summary logging prints the decoded payload without hex.
+    """
+    proxy = MeshCoreProxy(serial_port="/dev/ttyUSB0", event_log_level=EventLogLevel.SUMMARY)
+
+    proxy._log_event_to_radio(0x16, b"\x16\x03")
+    proxy._log_event_from_radio(0x0A, b"\x0a")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "-> CMD_DEVICE_QUERY: query=device_info",
+        "<- NO_MORE_MSGS",
+    ]
+
+
+def test_event_log_level_change(capsys):
+    """
+    Tests that changing the event log level after construction takes effect.
+    """
+    proxy = MeshCoreProxy(serial_port="/dev/ttyUSB0", event_log_level=EventLogLevel.OFF)
+
+    proxy._log_event_to_radio(0x16, b"\x16\x03")
+    assert capsys.readouterr().out == ""
+
+    proxy.event_log_level = EventLogLevel.VERBOSE
+    proxy._log_event_to_radio(0x16, b"\x16\x03")
+    assert capsys.readouterr().out.splitlines() == [
+        "-> CMD_DEVICE_QUERY: query=device_info",
+        "   [2 bytes]: 1603",
+    ]
+
+
+def test_event_log_json(capsys):
+    """
+    Tests that JSON logging emits one compact object per event.
+    """
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.VERBOSE,
+        event_log_json=True,
+    )
+
+    proxy._log_event_from_radio(0x09, b"\x09\x10\x00\x00\x00")
+
+    assert capsys.readouterr().out == (
+        '{"direction":"FROM_RADIO","packet_type":"CURRENT_TIME","packet_type_raw":9,'
+        '"decoded":{"time":16},"payload_hex":"0910000000","payload_len":5}\n'
+    )
+
+
+@pytest.mark.asyncio
+@patch("meshcore_proxy.proxy.SerialConnection")
+async def test_event_log_writer_task(mock_serial_connection, capsys):
+    """
+    Tests that events logged while running are written by the writer task
+    and that queued lines are flushed on shutdown.
+    """
+    mock_serial_connection.return_value = MockRadio()
+
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.SUMMARY,
+        tcp_port=5004,
+    )
+
+    proxy_task = asyncio.create_task(proxy.run())
+    await asyncio.sleep(0.5)
+    assert proxy._log_writer_task is not None
+
+    await proxy._handle_radio_rx(b"\x0a")
+    await asyncio.sleep(0.1)
+    assert capsys.readouterr().out == "<- NO_MORE_MSGS\n"
+
+    # Lines still queued when the proxy stops are not lost
+    proxy._log_event_to_radio(0x16, b"\x16\x03")
+    proxy_task.cancel()
+    try:
+        await proxy_task
+    except asyncio.CancelledError:
+        pass
+
+    assert capsys.readouterr().out == "-> CMD_DEVICE_QUERY: query=device_info\n"
+    assert proxy._log_writer_task is None
+
+
+@pytest.mark.asyncio
+@patch("meshcore_proxy.proxy.SerialConnection")
+async def test_event_log_writer_survives_write_errors(mock_serial_connection, capsys):
+    """
+    Tests that a failing stdout write doesn't kill the writer task or make
+    shutdown raise.
+    """
+    mock_serial_connection.return_value = MockRadio()
+
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.SUMMARY,
+        tcp_port=5007,
+    )
+
+    proxy_task = asyncio.create_task(proxy.run())
+    await asyncio.sleep(0.5)
+
+    with patch("sys.stdout.write", side_effect=BrokenPipeError):
+        await proxy._handle_radio_rx(b"\x0a")
+        await asyncio.sleep(0.1)
+        assert not proxy._log_writer_task.done()
+
+        # The final flush on shutdown fails too, but stop() still completes
+        proxy._log_event_to_radio(0x16, b"\x16\x03")
+        proxy_task.cancel()
+        try:
+            await proxy_task
+        except asyncio.CancelledError:
+            pass
+
+    assert proxy._log_writer_task is None
+
+    # With the writer gone, lines are printed directly
+    proxy._log_event_from_radio(0x0A, b"\x0a")
+    assert capsys.readouterr().out == "<- NO_MORE_MSGS\n"
+
+
+def test_json_encoders_equivalent():
+    """
+    Tests that the orjson and stdlib JSON paths produce the same parsed
+    objects, even where their number formatting differs.
+    """
+    decoded = {
+        "name": "Zoë 📡",
+        "lat": 1e-06,
+        "lon": -122.25,
+        "vars": {"gps": "1"},
+        "ok": True,
+        "missing": None,
+    }
+    for encode in (_dumps_json, _dumps_json_stdlib):
+        line = encode(decoded)
+        assert ", " not in line and ": " not in line  # compact separators
+        assert json.loads(line) == decoded
+
+
+def test_event_log_json_summary(capsys):
+    """
+    Tests that JSON summary logging omits the raw payload and empty decodes.
+    """
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.SUMMARY,
+        event_log_json=True,
+    )
+
+    proxy._log_event_to_radio(0x05, b"\x05")
+    proxy._log_event_from_radio(0xFE, b"\xfe\x01")
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines == [
+        {"direction": "TO_RADIO", "packet_type": "CMD_GET_TIME", "packet_type_raw": 5},
+        {"direction": "FROM_RADIO", "packet_type": "RESP_UNKNOWN(0xfe)", "packet_type_raw": 254},
+    ]
+
+
+@pytest.mark.asyncio
+@patch("meshcore_proxy.proxy.SerialConnection")
+async def test_tcp_client_frames_forwarded(mock_serial_connection):
+    """
+    Tests that frames from a TCP client reach the radio, whether they arrive
+    split across reads or several in one read, and that radio data is
+    framed back to the client.
+    """
+    mock_radio = MockRadio()
+    mock_serial_connection.return_value = mock_radio
+
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.OFF,
+        tcp_host="127.0.0.1",
+        tcp_port=5005,
+    )
+
+    proxy_task = asyncio.create_task(proxy.run())
+    await asyncio.sleep(0.5)
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", 5005)
+    writer.write(b"\x3c\x03\x00\x01\x02")
+    await writer.drain()
+    await asyncio.sleep(0.1)
+    writer.write(b"\x03\x3c\x01\x00\x16\x3c\x00\x00")
+    await writer.drain()
+    await asyncio.sleep(0.1)
+
+    assert mock_radio.send_buffer == [b"\x01\x02\x03", b"\x16", b""]
+
+    await proxy._handle_radio_rx(b"\x0a\x0b")
+    assert await asyncio.wait_for(reader.readexactly(5), timeout=1) == b"\x3c\x02\x00\x0a\x0b"
+
+    writer.close()
+    await writer.wait_closed()
+    proxy_task.cancel()
+    try:
+        await proxy_task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+@patch("meshcore_proxy.proxy.SerialConnection")
+async def test_slow_client_disconnected(mock_serial_connection):
+    """
+    Tests that a client which stops reading is dropped once its write buffer
+    passes the high-water mark, while other clients keep receiving data.
+    """
+    mock_radio = MockRadio()
+    mock_serial_connection.return_value = mock_radio
+
+    proxy = MeshCoreProxy(
+        serial_port="/dev/ttyUSB0",
+        event_log_level=EventLogLevel.OFF,
+        tcp_host="127.0.0.1",
+        tcp_port=5006,
+    )
+
+    lost = []
+    connection_lost = _ClientProtocol.connection_lost
+
+    def record_connection_lost(protocol, exc):
+        lost.append(protocol._client.addr)
+        connection_lost(protocol, exc)
+
+    loop = asyncio.get_running_loop()
+    with patch.object(_ClientProtocol, "connection_lost", record_connection_lost):
+        proxy_task = asyncio.create_task(proxy.run())
+        await asyncio.sleep(0.5)
+
+        # A client with a tiny receive buffer that never reads
+        slow_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        slow_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        slow_sock.setblocking(False)
+        await loop.sock_connect(slow_sock, ("127.0.0.1", 5006))
+        slow_addr = slow_sock.getsockname()
+
+        fast_reader, fast_writer = await asyncio.open_connection("127.0.0.1", 5006)
+        await asyncio.sleep(0.1)
+        assert len(proxy._clients) == 2
+
+        received = 0
+
+        async def read_fast():
+            nonlocal received
+            while chunk := await fast_reader.read(65536):
+                received += len(chunk)
+
+        fast_task = asyncio.create_task(read_fast())
+
+        frame = b"\x0a" * 60000
+        sent = 0
+        while slow_addr in proxy._clients and sent < 1000:
+            await proxy._handle_radio_rx(frame)
+            sent += 1
+            await asyncio.sleep(0.001)
+
+        assert slow_addr not in proxy._clients
+        await asyncio.sleep(0.1)
+        assert slow_addr in lost
+
+        # The slow peer sees the connection end: a reset, or EOF after any buffered data
+        try:
+            while await asyncio.wait_for(loop.sock_recv(slow_sock, 65536), timeout=1):
+                pass
+        except ConnectionResetError:
+            pass
+
+        # The fast client is still connected and got every frame
+        await asyncio.sleep(0.2)
+        assert len(proxy._client_list) == 1
+        assert received == sent * (60000 + 3)
+
+        slow_sock.close()
+        fast_writer.close()
+        await fast_writer.wait_closed()
+        fast_task.cancel()
+        proxy_task.cancel()
+        try:
+            await proxy_task
+        except asyncio.CancelledError:
+            pass